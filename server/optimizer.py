@@ -4,140 +4,524 @@ Container Optimization Script
 Uses PuLP to solve a linear programming problem for optimal product selection
 """
 
+import os
 import sys
 import json
-import pandas as pd
 import pulp
 import numpy as np
 
+try:
+    import highspy
+except ImportError:
+    highspy = None
 
-def normalize_minmax(series):
-    """Normalize a series using min-max normalization"""
-    series = series.astype(float)
-    min_val, max_val = series.min(), series.max()
-    if np.isclose(max_val, min_val):
-        return pd.Series([0.5] * len(series))
-    return (series - min_val) / (max_val - min_val)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-def optimize_container(products_data, config):
+def njit(*args, **kwargs):
+    """Default when numba is disabled or missing: run the plain Python function"""
+    if args and callable(args[0]):
+        return args[0]
+    return lambda func: func
+
+
+prange = range
+
+# Numba is opt-in: the server starts a fresh process per request, so
+# importing numba and loading compiled kernels usually costs more than
+# the JIT saves
+USE_NUMBA = False
+if os.environ.get("OPTIMIZER_USE_NUMBA") == "1":
+    try:
+        from numba import njit, prange
+        USE_NUMBA = True
+    except ImportError:
+        pass
+
+
+# PuLP status code -> status string reported to the client
+STATUS_MAP = {
+    pulp.LpStatusOptimal: "Optimal",
+    pulp.LpStatusInfeasible: "Infeasible",
+    pulp.LpStatusUnbounded: "Unbounded",
+    pulp.LpStatusUndefined: "Undefined",
+    pulp.LpStatusNotSolved: "Error"
+}
+
+# HiGHS model status -> PuLP status code, for the direct highspy path
+HIGHS_STATUS_MAP = {} if highspy is None else {
+    highspy.HighsModelStatus.kOptimal: pulp.LpStatusOptimal,
+    highspy.HighsModelStatus.kInfeasible: pulp.LpStatusInfeasible,
+    highspy.HighsModelStatus.kUnboundedOrInfeasible: pulp.LpStatusInfeasible,
+    highspy.HighsModelStatus.kUnbounded: pulp.LpStatusUnbounded,
+}
+
+# (column, default, dtype) for each product field; a default of None
+# means the field is required
+PRODUCT_COLUMNS = [
+    ("SKU", None, object),
+    ("Description", None, object),
+    ("BoxLength_m", None, float),
+    ("BoxWidth_m", None, float),
+    ("BoxHeight_m", None, float),
+    ("WeightPerBox_kg", None, float),
+    ("ProfitPerBox", None, float),
+    ("CostPerBox", None, float),
+    ("AvailableStock", 0, float),
+    ("SalesPerDay", 0, float),
+    ("CoverageDays", 0, float),
+    ("MinShipQty", 0, float),
+    ("LeadTimeDays", None, float),
+]
+
+
+def load_columns(products_data, defaults=None):
     """
-    Main optimization function
+    Convert a list of product dictionaries into a dict of column arrays
     
     Args:
         products_data: List of product dictionaries
-        config: Dictionary with optimization configuration
+        defaults: Optional overrides for the defaults in PRODUCT_COLUMNS
     
     Returns:
-        Dictionary with optimization results
+        Dictionary mapping column name to a NumPy array
     """
-    # Extract configuration
-    CONTAINER_VOLUME_M3 = config["CONTAINER_VOLUME_M3"]
-    CONTAINER_MAX_WEIGHT_KG = config["CONTAINER_MAX_WEIGHT_KG"]
-    AVAILABLE_BUDGET = config["AVAILABLE_BUDGET"]
-    GLOBAL_LEAD_TIME_DAYS = config["GLOBAL_LEAD_TIME_DAYS"]
-    w_profit = config["w_profit"]
-    w_density = config["w_density"]
-    w_velocity = config["w_velocity"]
+    defaults = defaults or {}
+    cols = {}
+    for name, default, dtype in PRODUCT_COLUMNS:
+        default = defaults.get(name, default)
+        if default is None:
+            values = [p[name] for p in products_data]
+        else:
+            values = [p.get(name, default) for p in products_data]
+        cols[name] = np.array(values, dtype=dtype)
+    return cols
+
+
+@njit(cache=True)
+def normalize_minmax(values):
+    """Normalize an array using min-max normalization"""
+    min_val, max_val = values.min(), values.max()
+    if max_val - min_val < 1e-12:
+        return np.full_like(values, 0.5)
+    return (values - min_val) / (max_val - min_val)
+
+
+def preprocess(spd, lead_time, coverage, stock, length, width, height,
+               profit, w_profit, w_density, w_velocity):
+    """
+    Compute order quantities, box volumes, profit densities and scores
+    
+    Multi-term expressions are accumulated in place so each one allocates
+    a single result array rather than one per operator. With Numba enabled
+    the work is done by the parallel _preprocess_kernel instead.
+    
+    Returns:
+        Tuple of (order_qty, volume, profit_density, score) arrays
+    """
+    if USE_NUMBA:
+        return _preprocess_kernel(
+            spd, lead_time, coverage, stock, length, width, height,
+            profit, w_profit, w_density, w_velocity
+        )
     
-    # Convert to DataFrame
-    df = pd.DataFrame(products_data)
+    shortfall = lead_time + coverage
+    shortfall *= spd
+    shortfall -= stock
+    # Clamp in place so the int64 cast is the only extra allocation
+    np.maximum(shortfall, 0.0, out=shortfall)
+    order_qty = shortfall.astype(np.int64)
+    volume = length * width
+    volume *= height
+    np.maximum(volume, 1e-9, out=volume)
+    profit_density = profit / volume
     
-    # Ensure LeadTimeDays exists
-    if "LeadTimeDays" not in df.columns:
-        df["LeadTimeDays"] = GLOBAL_LEAD_TIME_DAYS
+    # normalize_minmax returns fresh arrays, so they can be weighted and
+    # summed in place
+    score = normalize_minmax(profit)
+    score *= w_profit
+    n_density = normalize_minmax(profit_density)
+    n_density *= w_density
+    score += n_density
+    n_velocity = normalize_minmax(spd)
+    n_velocity *= w_velocity
+    score += n_velocity
+    return order_qty, volume, profit_density, score
+
+
+@njit(parallel=True, cache=True)
+def _preprocess_kernel(spd, lead_time, coverage, stock, length, width, height,
+                       profit, w_profit, w_density, w_velocity):
+    """
+    preprocess as two parallel passes: per-product demand, volume and
+    density, then min-max reductions and the weighted score
+    """
+    n_products = len(spd)
+    order_qty = np.empty(n_products, dtype=np.int64)
+    volume = np.empty(n_products)
+    profit_density = np.empty(n_products)
+    for i in prange(n_products):
+        shortfall = spd[i] * (lead_time[i] + coverage[i]) - stock[i]
+        order_qty[i] = int(shortfall) if shortfall > 0.0 else 0
+        volume[i] = max(length[i] * width[i] * height[i], 1e-9)
+        profit_density[i] = profit[i] / volume[i]
     
-    # Fill missing values
-    for col in ["MinShipQty", "CoverageDays", "SalesPerDay", "AvailableStock"]:
-        if col not in df.columns:
-            df[col] = 0
+    n_profit = normalize_minmax(profit)
+    n_density = normalize_minmax(profit_density)
+    n_velocity = normalize_minmax(spd)
+    score = np.empty(n_products)
+    for i in prange(n_products):
+        score[i] = (
+            w_profit * n_profit[i]
+            + w_density * n_density[i]
+            + w_velocity * n_velocity[i]
+        )
+    return order_qty, volume, profit_density, score
+
+
+@njit(cache=True)
+def _greedy_fill_kernel(order, vols, wts, costs, min_qty, max_qty,
+                        volume_cap, weight_cap, budget):
+    """
+    Fill loop of greedy_fill over a precomputed visiting order
     
-    # Calculate demand and order quantities
-    df["DemandDuringLeadTime"] = df["SalesPerDay"] * df["LeadTimeDays"]
-    df["DemandDuringCoverage"] = df["SalesPerDay"] * df["CoverageDays"]
-    df["TotalNeeded"] = df["DemandDuringLeadTime"] + df["DemandDuringCoverage"]
-    df["OrderQty"] = (df["TotalNeeded"] - df["AvailableStock"]).clip(lower=0).astype(int)
-    df["MaxShippable"] = df["OrderQty"]
+    Takes ndarrays when jitted and plain lists otherwise, since a Python
+    loop over lists avoids boxing a NumPy scalar on every element access.
+    """
+    qty = np.zeros(len(order), dtype=np.int64)
+    vol_left, wt_left, budget_left = volume_cap, weight_cap, budget
     
-    # Calculate volume per box
-    df["VolumePerBox_m3"] = df["BoxLength_m"] * df["BoxWidth_m"] * df["BoxHeight_m"]
-    df["VolumePerBox_m3"] = df["VolumePerBox_m3"].replace(0, 1e-9)
+    for i in order:
+        take = max_qty[i]
+        if vols[i] > 0:
+            take = min(take, vol_left // vols[i])
+        if wts[i] > 0:
+            take = min(take, wt_left // wts[i])
+        if costs[i] > 0:
+            take = min(take, budget_left // costs[i])
+        if take <= 0 or take < min_qty[i]:
+            continue
+        n_boxes = int(take)
+        qty[i] = n_boxes
+        vol_left -= n_boxes * vols[i]
+        wt_left -= n_boxes * wts[i]
+        budget_left -= n_boxes * costs[i]
     
-    # Calculate profit per cubic meter
-    df["ProfitPerCubicMeter"] = df["ProfitPerBox"] / df["VolumePerBox_m3"]
+    return qty
+
+
+def greedy_fill(scores, vols, wts, costs, min_qty, max_qty,
+                volume_cap, weight_cap, budget):
+    """
+    Build a feasible integer solution by filling the container in order of
+    score per cubic meter, used as a warm start for the MILP solver
     
-    # Normalize and calculate scores
-    df["n_profit"] = normalize_minmax(df["ProfitPerBox"])
-    df["n_density"] = normalize_minmax(df["ProfitPerCubicMeter"])
-    df["n_velocity"] = normalize_minmax(df["SalesPerDay"])
-    df["score"] = w_profit * df["n_profit"] + w_density * df["n_density"] + w_velocity * df["n_velocity"]
+    Returns:
+        int64 array of quantities aligned with the input arrays
+    """
+    columns = [
+        np.argsort(-scores / vols, kind="stable"),
+        np.ascontiguousarray(vols, dtype=np.float64),
+        np.ascontiguousarray(wts, dtype=np.float64),
+        np.ascontiguousarray(costs, dtype=np.float64),
+        np.ascontiguousarray(min_qty, dtype=np.float64),
+        np.ascontiguousarray(max_qty, dtype=np.float64),
+    ]
+    if not USE_NUMBA:
+        columns = [column.tolist() for column in columns]
+    return _greedy_fill_kernel(
+        *columns, float(volume_cap), float(weight_cap), float(budget)
+    )
+
+
+# RAM-backed directory for CBC's temporary LP/solution files, if present
+SHM_DIR = "/dev/shm"
+
+
+def get_solver():
+    """Return the CBC solver used by the PuLP path"""
+    cbc = pulp.PULP_CBC_CMD(msg=0, warmStart=True, keepFiles=False)
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        cbc.tmpDir = SHM_DIR
+    return cbc
+
+
+# Model structures for the whole (unpruned) catalog keyed on (SKUs,
+# MinShipQty, MaxShippable), reused across calls that only change scores,
+# coefficients or capacities
+_MODEL_CACHE = {}
+MODEL_CACHE_SIZE = 8
+
+
+def build_model(skus, min_qty_arr, max_ship_arr):
+    """
+    Create the decision variables, capacity constraints and MinQty
+    constraints for a catalog
     
-    # Create optimization model
+    The objective, the capacity coefficients/right-hand sides and the x
+    upper bounds are set by solve_pulp before every solve.
+    
+    Returns:
+        Tuple of (model, x_vars, y_vars, x_list, capacity_constraints)
+    """
     model = pulp.LpProblem("Container_Optimization", pulp.LpMaximize)
     
     # Decision variables
     x_vars = {}
-    for idx, row in df.iterrows():
-        upper_bound = int(row["MaxShippable"])
-        x_vars[row["SKU"]] = pulp.LpVariable(
-            f"x_{row['SKU']}", 
+    for i, sku in enumerate(skus):
+        x_vars[sku] = pulp.LpVariable(
+            f"x_{sku}", 
             lowBound=0, 
-            upBound=upper_bound, 
+            upBound=int(max_ship_arr[i]), 
             cat="Integer"
         )
     
-    # Binary variables for minimum shipment quantity constraints
+    x_list = [x_vars[sku] for sku in skus]
+    
+    # Constraints: Volume, Weight and Budget
+    capacity_constraints = {}
+    for name in ("Volume_Constraint", "Weight_Constraint", "Budget_Constraint"):
+        constraint = pulp.LpConstraint(
+            pulp.LpAffineExpression(), sense=pulp.LpConstraintLE, name=name, rhs=0
+        )
+        model += constraint
+        capacity_constraints[name] = constraint
+    
+    # Constraint: Minimum shipment quantities. A minimum of 0 or 1 is
+    # already implied by the integer bounds on x, so only SKUs with a real
+    # minimum get a binary y variable and the linking pair.
     y_vars = {}
-    for idx, row in df.iterrows():
-        y_vars[row["SKU"]] = pulp.LpVariable(f"y_{row['SKU']}", cat="Binary")
-    
-    # Objective: Maximize total score
-    model += pulp.lpSum([
-        df.loc[df["SKU"] == sku, "score"].iloc[0] * x_vars[sku] 
-        for sku in df["SKU"]
-    ]), "Total_Score"
-    
-    # Constraint: Volume
-    model += pulp.lpSum([
-        df.loc[df["SKU"] == sku, "VolumePerBox_m3"].iloc[0] * x_vars[sku] 
-        for sku in df["SKU"]
-    ]) <= CONTAINER_VOLUME_M3, "Volume_Constraint"
-    
-    # Constraint: Weight
-    model += pulp.lpSum([
-        df.loc[df["SKU"] == sku, "WeightPerBox_kg"].iloc[0] * x_vars[sku] 
-        for sku in df["SKU"]
-    ]) <= CONTAINER_MAX_WEIGHT_KG, "Weight_Constraint"
-    
-    # Constraint: Budget
-    model += pulp.lpSum([
-        df.loc[df["SKU"] == sku, "CostPerBox"].iloc[0] * x_vars[sku] 
-        for sku in df["SKU"]
-    ]) <= AVAILABLE_BUDGET, "Budget_Constraint"
-    
-    # Constraint: Minimum shipment quantities
-    for idx, row in df.iterrows():
-        sku = row["SKU"]
-        min_qty = int(row["MinShipQty"])
-        max_qty = int(row["MaxShippable"])
+    for i in np.flatnonzero(min_qty_arr >= 2):
+        sku = skus[i]
+        min_qty = int(min_qty_arr[i])
+        max_qty = int(max_ship_arr[i])
         
+        y_vars[sku] = pulp.LpVariable(f"y_{sku}", cat="Binary")
         # If y=1, then x >= min_qty; if y=0, then x = 0
         model += x_vars[sku] >= min_qty * y_vars[sku], f"MinQty_{sku}_lower"
         model += x_vars[sku] <= max_qty * y_vars[sku], f"MinQty_{sku}_upper"
     
+    return model, x_vars, y_vars, x_list, capacity_constraints
+
+
+def get_model(skus, min_qty_arr, max_ship_arr):
+    """Return a cached model structure for the catalog, building it if needed"""
+    key = (tuple(skus), tuple(min_qty_arr.tolist()), tuple(max_ship_arr.tolist()))
+    if key not in _MODEL_CACHE:
+        if len(_MODEL_CACHE) >= MODEL_CACHE_SIZE:
+            _MODEL_CACHE.pop(next(iter(_MODEL_CACHE)))
+        _MODEL_CACHE[key] = build_model(skus, min_qty_arr, max_ship_arr)
+    return _MODEL_CACHE[key]
+
+
+def solve_pulp(cols, active, capacities, initial_qty):
+    """
+    Solve the MILP through PuLP and CBC, reusing cached model structures
+    
+    The cached structure spans the whole catalog so that its key does not
+    depend on which SKUs the capacities prune; pruned SKUs are switched
+    off for this call with an upper bound of zero.
+    
+    Returns:
+        Tuple of (PuLP status code, int64 quantity array over active SKUs)
+    """
+    # Fetch (or build) the model structure for this catalog, then load
+    # this call's objective, capacity coefficients and capacities into it
+    model, x_vars, y_vars, x_list, capacity_constraints = get_model(
+        cols["SKU"].tolist(), cols["MinShipQty"], cols["MaxShippable"]
+    )
+    model.setObjective(
+        pulp.LpAffineExpression(zip(x_list, cols["score"].tolist()))
+    )
+    for name, column, capacity in zip(
+        ("Volume_Constraint", "Weight_Constraint", "Budget_Constraint"),
+        ("VolumePerBox_m3", "WeightPerBox_kg", "CostPerBox"),
+        capacities,
+    ):
+        constraint = capacity_constraints[name]
+        constraint.expr = pulp.LpAffineExpression(
+            zip(x_list, cols[column].tolist())
+        )
+        constraint.changeRHS(capacity)
+    
+    # Bounds and warm start: pruned SKUs are capped at zero, active ones
+    # at MaxShippable and seeded with the greedy incumbent
+    upper = np.where(active, cols["MaxShippable"], 0)
+    start = np.zeros(len(x_list), dtype=np.int64)
+    start[active] = initial_qty
+    for x_var, upper_bound, qty in zip(x_list, upper.tolist(), start.tolist()):
+        x_var.upBound = upper_bound
+        x_var.setInitialValue(qty)
+    for sku, y_var in y_vars.items():
+        y_var.setInitialValue(1 if x_vars[sku].varValue > 0 else 0)
+    
     # Solve
-    solver = pulp.PULP_CBC_CMD(msg=0)
-    status = model.solve(solver)
+    status = model.solve(get_solver())
+    qty = np.array(
+        [int(x_var.varValue or 0) for x_var in x_list], dtype=np.int64
+    )
+    return status, qty[active]
+
+
+def solve_highs(scores, vols, wts, costs, min_qty_arr, max_ship_arr,
+                capacities, initial_qty):
+    """
+    Solve the MILP in-process with highspy, bypassing PuLP
+    
+    Columns are the x quantities followed by one binary y per SKU with a
+    MinShipQty above one. Rows are the volume, weight and budget
+    capacities followed by the MinQty linking pair for each y, assembled
+    row-wise straight from the column arrays.
+    
+    Returns:
+        Tuple of (PuLP status code, int64 quantity array)
+    """
+    n_skus = len(scores)
+    if n_skus == 0:
+        # Nothing to ship: feasible unless a capacity is itself negative
+        if min(capacities) < 0:
+            return pulp.LpStatusInfeasible, np.zeros(0, dtype=np.int64)
+        return pulp.LpStatusOptimal, np.zeros(0, dtype=np.int64)
+    
+    min_idx = np.flatnonzero(min_qty_arr >= 2)
+    n_min = len(min_idx)
+    n_cols = n_skus + n_min
+    
+    # Capacity rows are dense over x. Each SKU with a minimum adds
+    # x - min*y >= 0 and x - max*y <= 0 over its (x, y) column pair.
+    link_index = np.repeat(
+        np.column_stack([min_idx, n_skus + np.arange(n_min)]), 2, axis=0
+    )
+    link_value = np.column_stack([
+        np.ones(n_min), -min_qty_arr[min_idx].astype(np.int64),
+        np.ones(n_min), -max_ship_arr[min_idx].astype(np.int64),
+    ])
+    a_start = np.concatenate([
+        np.arange(3) * n_skus, 3 * n_skus + 2 * np.arange(2 * n_min + 1)
+    ])
+    a_index = np.concatenate([np.tile(np.arange(n_skus), 3), link_index.ravel()])
+    a_value = np.concatenate([vols, wts, costs, link_value.ravel()])
+    
+    lp = highspy.HighsLp()
+    lp.num_col_ = n_cols
+    lp.num_row_ = 3 + 2 * n_min
+    lp.sense_ = highspy.ObjSense.kMaximize
+    lp.col_cost_ = np.concatenate([scores, np.zeros(n_min)])
+    lp.col_lower_ = np.zeros(n_cols)
+    lp.col_upper_ = np.concatenate([max_ship_arr.astype(float), np.ones(n_min)])
+    lp.row_lower_ = np.concatenate([
+        np.full(3, -np.inf), np.tile([0.0, -np.inf], n_min)
+    ])
+    lp.row_upper_ = np.concatenate([
+        np.asarray(capacities, dtype=float), np.tile([np.inf, 0.0], n_min)
+    ])
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.start_ = a_start
+    lp.a_matrix_.index_ = a_index
+    lp.a_matrix_.value_ = a_value
+    lp.integrality_ = [highspy.HighsVarType.kInteger] * n_cols
+    
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.passModel(lp)
+    
+    # Warm start: the greedy incumbent, with y set wherever x is shipped
+    start = highspy.HighsSolution()
+    start.col_value = np.concatenate([
+        initial_qty, initial_qty[min_idx] > 0
+    ]).astype(float).tolist()
+    start.value_valid = True
+    h.setSolution(start)
+    
+    h.run()
+    status = HIGHS_STATUS_MAP.get(h.getModelStatus(), pulp.LpStatusNotSolved)
+    col_value = np.asarray(h.getSolution().col_value[:n_skus])
+    return status, np.rint(col_value).astype(np.int64)
+
+
+def optimize_container(products_data, config):
+    """
+    Main optimization function
+    
+    Args:
+        products_data: List of product dictionaries
+        config: Dictionary with optimization configuration
+    
+    Returns:
+        Dictionary with optimization results
+    """
+    # Extract configuration
+    CONTAINER_VOLUME_M3 = config["CONTAINER_VOLUME_M3"]
+    CONTAINER_MAX_WEIGHT_KG = config["CONTAINER_MAX_WEIGHT_KG"]
+    AVAILABLE_BUDGET = config["AVAILABLE_BUDGET"]
+    GLOBAL_LEAD_TIME_DAYS = config["GLOBAL_LEAD_TIME_DAYS"]
+    w_profit = config["w_profit"]
+    w_density = config["w_density"]
+    w_velocity = config["w_velocity"]
+    
+    # Convert to column arrays, filling missing lead times from the config
+    cols = load_columns(
+        products_data, {"LeadTimeDays": GLOBAL_LEAD_TIME_DAYS}
+    )
+    
+    # Calculate demand, order quantities, box volume, profit density and
+    # scores
+    order_qty, volume, profit_density, score = preprocess(
+        cols["SalesPerDay"], cols["LeadTimeDays"], cols["CoverageDays"],
+        cols["AvailableStock"], cols["BoxLength_m"], cols["BoxWidth_m"],
+        cols["BoxHeight_m"], cols["ProfitPerBox"],
+        float(w_profit), float(w_density), float(w_velocity)
+    )
+    cols["OrderQty"] = order_qty
+    cols["MaxShippable"] = order_qty
+    cols["VolumePerBox_m3"] = volume
+    cols["ProfitPerCubicMeter"] = profit_density
+    cols["score"] = score
+    
+    # Drop SKUs that can never be shipped (nothing to order, or a single
+    # box already exceeds a capacity) so the MILP solver does not have to
+    # prove them zero
+    active = (
+        (cols["OrderQty"] > 0)
+        & (cols["OrderQty"] >= cols["MinShipQty"])
+        & (cols["CostPerBox"] <= AVAILABLE_BUDGET)
+        & (cols["VolumePerBox_m3"] <= CONTAINER_VOLUME_M3)
+        & (cols["WeightPerBox_kg"] <= CONTAINER_MAX_WEIGHT_KG)
+    )
+    
+    # Restrict every column to the active rows; everything below indexes
+    # them positionally
+    skus = cols["SKU"][active].tolist()
+    descriptions = cols["Description"][active].tolist()
+    scores = cols["score"][active]
+    vols = cols["VolumePerBox_m3"][active]
+    wts = cols["WeightPerBox_kg"][active]
+    costs = cols["CostPerBox"][active]
+    profits = cols["ProfitPerBox"][active]
+    order_qty_arr = cols["OrderQty"][active]
+    min_qty_arr = cols["MinShipQty"][active]
+    max_ship_arr = cols["MaxShippable"][active]
+    
+    # Warm start: a greedy incumbent for the MILP solver
+    capacities = (CONTAINER_VOLUME_M3, CONTAINER_MAX_WEIGHT_KG, AVAILABLE_BUDGET)
+    initial_qty = greedy_fill(
+        scores, vols, wts, costs, min_qty_arr, max_ship_arr, *capacities
+    )
+    
+    # Solve in-process with HiGHS when available, otherwise via PuLP + CBC
+    if highspy is not None:
+        status, qty = solve_highs(
+            scores, vols, wts, costs, min_qty_arr, max_ship_arr,
+            capacities, initial_qty
+        )
+    else:
+        status, qty = solve_pulp(cols, active, capacities, initial_qty)
     
     # Get status string
-    status_map = {
-        pulp.LpStatusOptimal: "Optimal",
-        pulp.LpStatusInfeasible: "Infeasible",
-        pulp.LpStatusUnbounded: "Unbounded",
-        pulp.LpStatusUndefined: "Undefined",
-        pulp.LpStatusNotSolved: "Error"
-    }
-    status_str = status_map.get(status, "Error")
+    status_str = STATUS_MAP.get(status, "Error")
     
     # Extract results
     results = {
@@ -156,43 +540,45 @@ def optimize_container(products_data, config):
     }
     
     if status == pulp.LpStatusOptimal:
-        selected_items = []
-        total_boxes = 0
-        total_volume = 0.0
-        total_weight = 0.0
-        total_cost = 0.0
-        total_profit = 0.0
-        total_score = 0.0
+        volume_used = qty * vols
+        weight_used = qty * wts
+        cost = qty * costs
+        profit = qty * profits
+        score_value = qty * scores
+        
+        total_boxes = int(qty.sum())
+        total_volume = volume_used.sum()
+        total_weight = weight_used.sum()
+        total_cost = cost.sum()
+        total_profit = profit.sum()
+        total_score = score_value.sum()
         
-        for idx, row in df.iterrows():
-            sku = row["SKU"]
-            selected_qty = int(x_vars[sku].varValue or 0)
-            
-            if selected_qty > 0:
-                volume_used = selected_qty * row["VolumePerBox_m3"]
-                weight_used = selected_qty * row["WeightPerBox_kg"]
-                cost = selected_qty * row["CostPerBox"]
-                profit = selected_qty * row["ProfitPerBox"]
-                score_value = selected_qty * row["score"]
-                
-                total_boxes += selected_qty
-                total_volume += volume_used
-                total_weight += weight_used
-                total_cost += cost
-                total_profit += profit
-                total_score += score_value
-                
-                selected_items.append({
-                    "SKU": sku,
-                    "Description": row["Description"],
-                    "SelectedQty": selected_qty,
-                    "VolumeUsed_m3": float(volume_used),
-                    "WeightUsed_kg": float(weight_used),
-                    "TotalCost": float(cost),
-                    "TotalProfit": float(profit),
-                    "Score": float(score_value),
-                    "OrderQty": int(row["OrderQty"])
-                })
+        # Convert the selected rows to Python scalars with one tolist()
+        # per column instead of a float()/int() call per value
+        sel = np.flatnonzero(qty)
+        selected_items = [
+            {
+                "SKU": skus[i],
+                "Description": descriptions[i],
+                "SelectedQty": q,
+                "VolumeUsed_m3": v,
+                "WeightUsed_kg": w,
+                "TotalCost": c,
+                "TotalProfit": p,
+                "Score": sc,
+                "OrderQty": oq
+            }
+            for i, q, v, w, c, p, sc, oq in zip(
+                sel.tolist(),
+                qty[sel].tolist(),
+                volume_used[sel].tolist(),
+                weight_used[sel].tolist(),
+                cost[sel].tolist(),
+                profit[sel].tolist(),
+                score_value[sel].tolist(),
+                order_qty_arr[sel].tolist()
+            )
+        ]
         
         results.update({
             "totalBoxes": total_boxes,
@@ -210,16 +596,35 @@ def optimize_container(products_data, config):
     return results
 
 
+def read_input():
+    """Parse the JSON request from stdin, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(sys.stdin.buffer.read())
+    return json.loads(sys.stdin.read())
+
+
+def write_output(results):
+    """Write results to stdout as JSON, using orjson when installed"""
+    if orjson is not None:
+        sys.stdout.buffer.write(
+            orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY)
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+    else:
+        print(json.dumps(results))
+
+
 if __name__ == "__main__":
     # Read input from stdin
-    input_data = json.loads(sys.stdin.read())
+    input_data = read_input()
     
     try:
         results = optimize_container(
             input_data["products"],
             input_data["config"]
         )
-        print(json.dumps(results))
+        write_output(results)
         sys.exit(0)
     except Exception as e:
         error_result = {
@@ -236,5 +641,5 @@ if __name__ == "__main__":
             "totalScore": 0.0,
             "selectedItems": []
         }
-        print(json.dumps(error_result))
+        write_output(error_result)
         sys.exit(1)
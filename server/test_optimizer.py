@@ -0,0 +1,218 @@
+"""
+Smoke tests for the optimizer script
+Run with: python -m unittest server/test_optimizer.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import optimizer  # noqa: E402
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "optimizer.py")
+
+# Runs optimizer.py as __main__ with orjson made unimportable. The script
+# directory goes first on sys.path, as it does for `python optimizer.py`
+RUN_WITHOUT_ORJSON = (
+    "import os, runpy, sys; "
+    "sys.modules['orjson'] = None; "
+    "sys.argv = [sys.argv[1]]; "
+    "sys.path.insert(0, os.path.dirname(sys.argv[0])); "
+    "runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+
+REQUEST = {
+    "products": [
+        {
+            "SKU": "A1",
+            "Description": "Small box",
+            "BoxLength_m": 0.5,
+            "BoxWidth_m": 0.4,
+            "BoxHeight_m": 0.3,
+            "WeightPerBox_kg": 10,
+            "AvailableStock": 5,
+            "SalesPerDay": 2,
+            "CoverageDays": 30,
+            "ProfitPerBox": 20,
+            "CostPerBox": 50,
+            "MinShipQty": 0,
+        },
+        {
+            "SKU": "B2",
+            "Description": "Large box",
+            "BoxLength_m": 1.0,
+            "BoxWidth_m": 0.8,
+            "BoxHeight_m": 0.6,
+            "WeightPerBox_kg": 40,
+            "AvailableStock": 0,
+            "SalesPerDay": 1,
+            "CoverageDays": 20,
+            "ProfitPerBox": 60,
+            "CostPerBox": 150,
+            "MinShipQty": 10,
+        },
+    ],
+    "config": {
+        "CONTAINER_VOLUME_M3": 20,
+        "CONTAINER_MAX_WEIGHT_KG": 5000,
+        "AVAILABLE_BUDGET": 10000,
+        "GLOBAL_LEAD_TIME_DAYS": 30,
+        "w_profit": 0.5,
+        "w_density": 0.3,
+        "w_velocity": 0.2,
+    },
+}
+
+
+def make_catalog(n_products, seed):
+    """Build a random product list in the shape the client sends"""
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "SKU": f"S{i}",
+            "Description": f"Item {i}",
+            "BoxLength_m": float(rng.uniform(0.1, 1.0)),
+            "BoxWidth_m": float(rng.uniform(0.1, 1.0)),
+            "BoxHeight_m": float(rng.uniform(0.1, 1.0)),
+            "WeightPerBox_kg": float(rng.uniform(1, 50)),
+            "AvailableStock": int(rng.integers(0, 200)),
+            "SalesPerDay": float(rng.uniform(0, 10)),
+            "CoverageDays": int(rng.integers(10, 60)),
+            "ProfitPerBox": float(rng.uniform(-5, 100)),
+            "CostPerBox": float(rng.choice([0.0, rng.uniform(5, 500)])),
+            "MinShipQty": int(rng.choice([0, 1, 5, 20, 80])),
+            "LeadTimeDays": int(rng.integers(5, 40)),
+        }
+        for i in range(n_products)
+    ]
+
+
+def make_config(volume, weight, budget):
+    return dict(
+        REQUEST["config"],
+        CONTAINER_VOLUME_M3=volume,
+        CONTAINER_MAX_WEIGHT_KG=weight,
+        AVAILABLE_BUDGET=budget,
+    )
+
+
+class OptimizerScriptTest(unittest.TestCase):
+    def run_script(self, args):
+        return subprocess.run(
+            [sys.executable] + args,
+            input=json.dumps(REQUEST),
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def check_result(self, proc):
+        self.assertEqual(proc.returncode, 0, proc.stderr or proc.stdout)
+        results = json.loads(proc.stdout)
+        self.assertEqual(results["status"], "Optimal")
+        self.assertGreater(results["totalBoxes"], 0)
+        self.assertLessEqual(
+            results["totalVolume_m3"], REQUEST["config"]["CONTAINER_VOLUME_M3"]
+        )
+
+    def test_runs(self):
+        self.check_result(self.run_script([SCRIPT_PATH]))
+
+    def test_runs_without_orjson(self):
+        self.check_result(self.run_script(["-c", RUN_WITHOUT_ORJSON, SCRIPT_PATH]))
+
+
+class ModelCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.saved_highspy = optimizer.highspy
+        optimizer.highspy = None
+        optimizer._MODEL_CACHE.clear()
+
+    def tearDown(self):
+        optimizer.highspy = self.saved_highspy
+        optimizer._MODEL_CACHE.clear()
+
+    def test_capacity_changes_reuse_one_model(self):
+        products = make_catalog(60, seed=7)
+        configs = [
+            make_config(67.7, 26000, 50000),
+            make_config(5, 26000, 400),
+            make_config(67.7, 100, 50000),
+            make_config(1, 30000, 20000),
+        ]
+        cached = [optimizer.optimize_container(products, c) for c in configs]
+        self.assertEqual(len(optimizer._MODEL_CACHE), 1)
+
+        for result, config in zip(cached, configs):
+            optimizer._MODEL_CACHE.clear()
+            fresh = optimizer.optimize_container(products, config)
+            self.assertEqual(result["status"], fresh["status"])
+            self.assertAlmostEqual(result["totalScore"], fresh["totalScore"], places=6)
+
+
+@unittest.skipIf(optimizer.highspy is None, "highspy is not installed")
+class BackendParityTest(unittest.TestCase):
+    def setUp(self):
+        self.saved_highspy = optimizer.highspy
+        optimizer._MODEL_CACHE.clear()
+
+    def tearDown(self):
+        optimizer.highspy = self.saved_highspy
+        optimizer._MODEL_CACHE.clear()
+
+    def solve_both(self, products, config):
+        optimizer.highspy = self.saved_highspy
+        highs = optimizer.optimize_container(products, config)
+        optimizer.highspy = None
+        cbc = optimizer.optimize_container(products, config)
+        return highs, cbc
+
+    def check_feasible(self, result, products, config):
+        min_qty = {p["SKU"]: p.get("MinShipQty", 0) for p in products}
+        for item in result["selectedItems"]:
+            self.assertGreaterEqual(item["SelectedQty"], min_qty[item["SKU"]])
+        for key, cap in [
+            ("totalVolume_m3", "CONTAINER_VOLUME_M3"),
+            ("totalWeight_kg", "CONTAINER_MAX_WEIGHT_KG"),
+            ("totalCost", "AVAILABLE_BUDGET"),
+        ]:
+            self.assertLessEqual(result[key], config[cap] * (1 + 1e-9) + 1e-9)
+
+    def test_backends_agree(self):
+        cases = [
+            (make_catalog(60, seed=7), make_config(67.7, 26000, 50000)),
+            (make_catalog(60, seed=7), make_config(5, 26000, 400)),
+            (make_catalog(120, seed=11), make_config(30, 2000, 20000)),
+            (make_catalog(200, seed=3), make_config(10, 30000, 5000)),
+        ]
+        for products, config in cases:
+            highs, cbc = self.solve_both(products, config)
+            self.assertEqual(highs["status"], "Optimal")
+            self.assertEqual(cbc["status"], "Optimal")
+            # HiGHS may stop anywhere within its default relative MIP gap of 1e-4
+            self.assertAlmostEqual(
+                highs["totalScore"], cbc["totalScore"],
+                delta=2e-4 * max(abs(cbc["totalScore"]), 1.0)
+            )
+            self.check_feasible(highs, products, config)
+            self.check_feasible(cbc, products, config)
+
+    def test_nothing_left_after_pruning(self):
+        # Every box costs more than the budget, so pruning drops all SKUs
+        products = make_catalog(40, seed=5)
+        for product in products:
+            product["CostPerBox"] = 100.0
+        config = make_config(67.7, 26000, 50)
+        for result in self.solve_both(products, config):
+            self.assertEqual(result["status"], "Optimal")
+            self.assertEqual(result["totalBoxes"], 0)
+            self.assertEqual(result["selectedItems"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()